@@ -6,7 +6,7 @@ Provides a unified command interface for developers to interact with
 the pipeline locally and consistently.
 
 Usage:
-    python devopsctl.py <command>
+    python devopsctl.py <command> [--fast]
 
 Commands:
     lint     Run linters (eslint, flake8)
@@ -14,22 +14,50 @@ Commands:
     build    Build packages
     docker   Build Docker image
     publish  Publish artifacts
-    all      Run complete pipeline (lint -> test -> build -> docker -> publish)
+    all      Run complete pipeline (lint + test -> build -> docker -> publish)
     version  Show version information
     help     Show this help message
+
+lint, test and build are skipped when their inputs are unchanged since
+their last successful run. Set DEVOPSCTL_FORCE=1 to run every stage
+regardless.
 """
 
-import argparse
+# Only os and sys are imported up front. Everything else is imported where
+# it is used so that quick commands such as `version` start fast.
 import os
-import subprocess
 import sys
-from pathlib import Path
+
+# Equivalent to typing.TYPE_CHECKING without importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    import queue
+    import subprocess
+    from typing import FrozenSet, Optional
 
 # Version information
 VERSION = "0.1.0"
-SCRIPT_DIR = Path(__file__).parent.absolute()
-PROJECT_ROOT = SCRIPT_DIR.parent
-SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+SCRIPTS_DIR = os.path.join(PROJECT_ROOT, "scripts")
+
+# Pipeline stages and the stages each one depends on. Stages without
+# dependencies between them (lint and test) run concurrently in `all`.
+PIPELINE_STAGES = {
+    "lint": [],
+    "test": [],
+    "build": ["lint", "test"],
+    "docker": ["build"],
+    "publish": ["docker"],
+}
+
+# Scripts never change while the CLI runs; resolve them once
+SCRIPT_PATHS = {name: os.path.join(SCRIPTS_DIR, f"{name}.sh") for name in PIPELINE_STAGES}
+
+# The CLI opens no descriptors meant to stay private and Python creates
+# them non-inheritable anyway, so skip the close-all-fds pass on POSIX.
+CLOSE_FDS = sys.platform == "win32"
 
 # Enable UTF-8 output on Windows
 if sys.platform == "win32":
@@ -57,51 +85,150 @@ class Colors:
         return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
 
 
-def safe_print(message: str) -> None:
-    """Print with fallback for encoding issues."""
+# Terminal color support does not change while the CLI runs, so the
+# color codes are baked into %-style line templates once
+COLORS_ENABLED = Colors.enabled()
+
+
+def _template(color: str, text: str) -> str:
+    """Wrap a line template in a color code when colors are enabled."""
+    if COLORS_ENABLED:
+        return f"{color}{text}{Colors.ENDC}\n"
+    return f"{text}\n"
+
+
+_HEADER_LINE = _template(Colors.BOLD + Colors.CYAN, "=" * 60)
+_HEADER_TMPL = "\n" + _HEADER_LINE + _template(Colors.BOLD + Colors.CYAN, "  %s") + _HEADER_LINE + "\n"
+_SUCCESS_TMPL = _template(Colors.GREEN, "[OK] %s")
+_ERROR_TMPL = _template(Colors.FAIL, "[FAIL] %s")
+_INFO_TMPL = _template(Colors.BLUE, "[INFO] %s")
+
+
+def safe_write(text: str) -> None:
+    """Write text to stdout with fallback for encoding issues."""
     try:
-        print(message)
+        sys.stdout.write(text)
     except UnicodeEncodeError:
         # Fallback: remove non-ASCII characters
-        ascii_msg = message.encode('ascii', errors='ignore').decode('ascii')
-        print(ascii_msg)
+        sys.stdout.write(text.encode('ascii', errors='ignore').decode('ascii'))
+
+
+def safe_print(message: str) -> None:
+    """Print with fallback for encoding issues."""
+    safe_write(message + "\n")
 
 
 def print_header(message: str) -> None:
     """Print a formatted header message."""
-    line = "=" * 60
-    if Colors.enabled():
-        safe_print(f"\n{Colors.BOLD}{Colors.CYAN}{line}{Colors.ENDC}")
-        safe_print(f"{Colors.BOLD}{Colors.CYAN}  {message}{Colors.ENDC}")
-        safe_print(f"{Colors.BOLD}{Colors.CYAN}{line}{Colors.ENDC}\n")
-    else:
-        safe_print(f"\n{line}")
-        safe_print(f"  {message}")
-        safe_print(f"{line}\n")
+    safe_write(_HEADER_TMPL % message)
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    if Colors.enabled():
-        safe_print(f"{Colors.GREEN}[OK] {message}{Colors.ENDC}")
-    else:
-        safe_print(f"[OK] {message}")
+    safe_write(_SUCCESS_TMPL % message)
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    if Colors.enabled():
-        safe_print(f"{Colors.FAIL}[FAIL] {message}{Colors.ENDC}")
-    else:
-        safe_print(f"[FAIL] {message}")
+    safe_write(_ERROR_TMPL % message)
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    if Colors.enabled():
-        safe_print(f"{Colors.BLUE}[INFO] {message}{Colors.ENDC}")
-    else:
-        safe_print(f"[INFO] {message}")
+    safe_write(_INFO_TMPL % message)
+
+
+_shell = None
+
+
+def get_shell() -> str:
+    """Return the bash executable used to run the pipeline scripts."""
+    global _shell
+    if _shell is None:
+        # Regular bash (might be in PATH from Git Bash or WSL)
+        _shell = "bash"
+        if sys.platform == "win32":
+            # Prefer Git Bash over WSL bash
+            git_bash = "C:/Program Files/Git/bin/bash.exe"
+            if os.path.exists(git_bash):
+                _shell = git_bash
+    return _shell
+
+
+_available_scripts = None
+
+
+def get_available_scripts() -> "FrozenSet[str]":
+    """Return the names of the scripts that exist, checking them on first use."""
+    global _available_scripts
+    if _available_scripts is None:
+        _available_scripts = frozenset(
+            name for name, path in SCRIPT_PATHS.items() if os.path.isfile(path)
+        )
+    return _available_scripts
+
+
+_script_env = None
+
+
+def get_script_env() -> "Optional[dict]":
+    """
+    Return the environment for the scripts.
+    
+    None inherits os.environ as-is, so the environment is only copied
+    (once) when PYTHONIOENCODING has to be added.
+    """
+    global _script_env
+    if _script_env is None and "PYTHONIOENCODING" not in os.environ:
+        _script_env = {**os.environ, "PYTHONIOENCODING": "utf-8"}
+    return _script_env
+
+
+def get_shell_command(script_path: str) -> list:
+    """
+    Build the command line used to run a shell script.
+    
+    Args:
+        script_path: Path of the script to run
+    
+    Returns:
+        Command as a list suitable for subprocess
+    """
+    return [get_shell(), script_path]
+
+
+def start_script(script_name: str, capture: bool = False) -> "subprocess.Popen":
+    """
+    Start a shell script from the scripts directory without waiting for it.
+    
+    Args:
+        script_name: Name of a script in SCRIPT_PATHS (without .sh extension)
+        capture: Merge stdout/stderr into a text pipe instead of the terminal
+    
+    Returns:
+        Handle of the running script
+    
+    Raises:
+        FileNotFoundError: If bash cannot be found
+    """
+    import subprocess
+    
+    output_args = {}
+    if capture:
+        output_args = {
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+            "encoding": "utf-8",
+            "errors": "replace",
+        }
+    
+    return subprocess.Popen(
+        get_shell_command(SCRIPT_PATHS[script_name]),
+        cwd=PROJECT_ROOT,
+        env=get_script_env(),
+        close_fds=CLOSE_FDS,
+        **output_args
+    )
 
 
 def run_script(script_name: str) -> int:
@@ -114,40 +241,139 @@ def run_script(script_name: str) -> int:
     Returns:
         Exit code from the script
     """
-    script_path = SCRIPTS_DIR / f"{script_name}.sh"
+    import stage_cache
     
-    if not script_path.exists():
-        print_error(f"Script not found: {script_path}")
+    if script_name not in get_available_scripts():
+        print_error(f"Script not found: {SCRIPT_PATHS[script_name]}")
         return 1
     
+    input_hash = stage_cache.current_input_hash(PROJECT_ROOT, script_name)
+    if stage_cache.is_fresh(PROJECT_ROOT, script_name, input_hash):
+        print_success(f"{script_name}.sh inputs unchanged since last successful run - skipped")
+        return 0
+    
     print_info(f"Running {script_name}.sh ...")
     
-    # Determine the shell to use
-    shell_cmd = None
+    try:
+        returncode = start_script(script_name).wait()
+    except FileNotFoundError:
+        print_error("Bash not found!")
+        print_info("On Windows, install Git Bash: https://git-scm.com/downloads")
+        return 1
+    
+    stage_cache.record(PROJECT_ROOT, script_name, input_hash, returncode)
+    return returncode
+
+
+class BashDaemon:
+    """
+    Long-lived bash process that runs scripts one after another.
     
-    if sys.platform == "win32":
-        # Try Git Bash first, then WSL bash
-        git_bash = Path("C:/Program Files/Git/bin/bash.exe")
-        if git_bash.exists():
-            shell_cmd = [str(git_bash), str(script_path)]
-        else:
-            # Try regular bash (might be in PATH from Git Bash or WSL)
-            shell_cmd = ["bash", str(script_path)]
-    else:
-        shell_cmd = ["bash", str(script_path)]
+    Each script is sourced in a subshell, which forks the running bash
+    instead of starting a new one, so `exit` and `set -e` inside a script
+    only end that script. Output is forwarded line by line until a
+    sentinel carrying the exit code is read.
     
-    try:
-        result = subprocess.run(
-            shell_cmd,
+    Example:
+        with BashDaemon() as bash:
+            bash.run("lint")
+    """
+    
+    SENTINEL = b"__DONE__"
+    
+    def __init__(self):
+        self.process = None
+    
+    def __enter__(self) -> "BashDaemon":
+        import subprocess
+        
+        self.process = subprocess.Popen(
+            [get_shell()],
             cwd=PROJECT_ROOT,
-            check=False,
-            env={**os.environ, "PYTHONIOENCODING": "utf-8"}
+            env=get_script_env(),
+            close_fds=CLOSE_FDS,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
         )
-        return result.returncode
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.process.stdin.close()
+        self.process.wait()
+    
+    def run(self, script_name: str) -> int:
+        """
+        Run a script from the scripts directory.
+        
+        Args:
+            script_name: Name of the script to run (without .sh extension)
+        
+        Returns:
+            Exit code from the script
+        """
+        import shlex
+        
+        script_path = shlex.quote(SCRIPT_PATHS[script_name].replace(os.sep, "/"))
+        # Scripts must not read the commands meant for the daemon
+        command = f"( . {script_path} ) </dev/null; printf '%s %d\\n' {self.SENTINEL.decode()} $?\n"
+        self.process.stdin.write(command.encode("utf-8"))
+        self.process.stdin.flush()
+        
+        for line in self.process.stdout:
+            # Output without a trailing newline shares a line with the sentinel
+            index = line.find(self.SENTINEL)
+            if index == -1:
+                safe_print(line.decode("utf-8", errors="replace").rstrip("\n"))
+                continue
+            if index > 0:
+                safe_print(line[:index].decode("utf-8", errors="replace"))
+            return int(line[index + len(self.SENTINEL):])
+        
+        # bash exited before reporting the result
+        return 1
+
+
+def run_scripts(script_names: list) -> int:
+    """
+    Run several scripts in order with a single bash process.
+    
+    Saves one process spawn per additional script compared to calling
+    run_script repeatedly. Execution stops at the first failing script.
+    
+    Args:
+        script_names: Names of the scripts to run (without .sh extension)
+    
+    Returns:
+        Exit code of the first failing script, or 0
+    """
+    import stage_cache
+    
+    for script_name in script_names:
+        if script_name not in get_available_scripts():
+            print_error(f"Script not found: {SCRIPT_PATHS[script_name]}")
+            return 1
+    
+    try:
+        with BashDaemon() as bash:
+            for script_name in script_names:
+                input_hash = stage_cache.current_input_hash(PROJECT_ROOT, script_name)
+                if stage_cache.is_fresh(PROJECT_ROOT, script_name, input_hash):
+                    print_success(f"{script_name}.sh inputs unchanged since last successful run - skipped")
+                    continue
+                
+                print_info(f"Running {script_name}.sh ...")
+                result = bash.run(script_name)
+                stage_cache.record(PROJECT_ROOT, script_name, input_hash, result)
+                if result != 0:
+                    print_error(f"{script_name}.sh failed with exit code {result}")
+                    return result
     except FileNotFoundError:
         print_error("Bash not found!")
         print_info("On Windows, install Git Bash: https://git-scm.com/downloads")
         return 1
+    
+    return 0
 
 
 def cmd_lint() -> int:
@@ -180,30 +406,111 @@ def cmd_publish() -> int:
     return run_script("publish")
 
 
-def cmd_all() -> int:
-    """Run the complete pipeline."""
+def run_stage(stage_name: str, output: "queue.Queue") -> int:
+    """
+    Run a pipeline stage, forwarding its output line by line.
+    
+    Args:
+        stage_name: Name of the stage (and its script)
+        output: Queue of (printer, message) pairs consumed by the printer thread
+    
+    Returns:
+        Exit code from the stage
+    """
+    import stage_cache
+    
+    output.put((print_info, f"Starting Stage: {stage_name.upper()}"))
+    
+    if stage_name not in get_available_scripts():
+        output.put((print_error, f"Script not found: {SCRIPT_PATHS[stage_name]}"))
+        return 1
+    
+    input_hash = stage_cache.current_input_hash(PROJECT_ROOT, stage_name)
+    if stage_cache.is_fresh(PROJECT_ROOT, stage_name, input_hash):
+        output.put((print_info, f"Inputs unchanged since last successful run - skipped {stage_name.upper()}"))
+        return 0
+    
+    try:
+        process = start_script(stage_name, capture=True)
+    except FileNotFoundError:
+        output.put((print_error, "Bash not found!"))
+        return 1
+    
+    prefix = f"[{stage_name}] "
+    for line in process.stdout:
+        output.put((safe_print, prefix + line.rstrip("\n")))
+    
+    returncode = process.wait()
+    stage_cache.record(PROJECT_ROOT, stage_name, input_hash, returncode)
+    return returncode
+
+
+def print_output(output: "queue.Queue") -> None:
+    """Print queued messages until a None sentinel is received."""
+    while True:
+        item = output.get()
+        if item is None:
+            return
+        printer, message = item
+        printer(message)
+
+
+def cmd_all(fast: bool = False) -> int:
+    """
+    Run the complete pipeline.
+    
+    Independent stages run concurrently with per-stage reporting. With
+    fast=True every stage runs sequentially in a single bash process.
+    """
     print_header("PIPELINE - Running Complete CI/CD Pipeline")
     
-    stages = [
-        ("LINT", cmd_lint),
-        ("TEST", cmd_test),
-        ("BUILD", cmd_build),
-        ("DOCKER", cmd_docker),
-        ("PUBLISH", cmd_publish),
-    ]
-    
-    for stage_name, stage_func in stages:
-        safe_print(f"\n{'='*60}")
-        print_info(f"Starting Stage: {stage_name}")
-        safe_print(f"{'='*60}")
-        
-        result = stage_func()
-        
+    if fast:
+        result = run_scripts(list(PIPELINE_STAGES))
         if result != 0:
-            print_error(f"Pipeline FAILED at stage: {stage_name}")
+            print_error("Pipeline FAILED")
             return result
-        
-        print_success(f"Stage {stage_name} completed")
+        safe_print("")
+        print_header("PIPELINE COMPLETED SUCCESSFULLY!")
+        return 0
+    
+    import queue
+    import threading
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    
+    output = queue.Queue()
+    printer = threading.Thread(target=print_output, args=(output,), daemon=True)
+    printer.start()
+    
+    results = {}
+    running = {}
+    failed_stage = None
+    
+    with ThreadPoolExecutor(max_workers=len(PIPELINE_STAGES)) as executor:
+        while failed_stage is None and len(results) < len(PIPELINE_STAGES):
+            # Submit every stage whose dependencies have all succeeded
+            for stage_name, deps in PIPELINE_STAGES.items():
+                if stage_name in results or stage_name in running.values():
+                    continue
+                if all(results.get(dep) == 0 for dep in deps):
+                    future = executor.submit(run_stage, stage_name, output)
+                    running[future] = stage_name
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage_name = running.pop(future)
+                results[stage_name] = future.result()
+                if results[stage_name] != 0:
+                    output.put((print_error, f"Pipeline FAILED at stage: {stage_name.upper()}"))
+                    failed_stage = failed_stage or stage_name
+                else:
+                    output.put((print_success, f"Stage {stage_name.upper()} completed"))
+    # Leaving the executor waits for stages that were still running on failure
+    
+    output.put(None)
+    printer.join()
+    
+    if failed_stage is not None:
+        return results[failed_stage]
     
     safe_print("")
     print_header("PIPELINE COMPLETED SUCCESSFULLY!")
@@ -223,8 +530,23 @@ def cmd_help() -> int:
     return 0
 
 
-def main() -> int:
-    """Main entry point for the CLI."""
+# Command dispatch
+_COMMANDS = {
+    "lint": cmd_lint,
+    "test": cmd_test,
+    "build": cmd_build,
+    "docker": cmd_docker,
+    "publish": cmd_publish,
+    "all": cmd_all,
+    "version": cmd_version,
+    "help": cmd_help,
+}
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the command line parser."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="DevOps Toolchain CLI - Run CI/CD pipeline locally",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -236,12 +558,13 @@ Examples:
   python devopsctl.py docker    Build Docker image
   python devopsctl.py publish   Publish artifacts
   python devopsctl.py all       Run complete pipeline
+  python devopsctl.py all --fast  Run pipeline in a single bash process
         """
     )
     
     parser.add_argument(
         "command",
-        choices=["lint", "test", "build", "docker", "publish", "all", "version", "help"],
+        choices=list(_COMMANDS),
         help="Command to execute"
     )
     
@@ -251,32 +574,55 @@ Examples:
         help="Enable verbose output"
     )
     
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Run all pipeline scripts in a single bash process (all only)"
+    )
+    
+    return parser
+
+
+_parser = None
+
+
+def _get_parser() -> "argparse.ArgumentParser":
+    """Return the command line parser, building it on first use."""
+    global _parser
+    if _parser is None:
+        _parser = _build_parser()
+    return _parser
+
+
+def dispatch(argv: list) -> int:
+    """
+    Run the command given by a list of command line arguments.
+    
+    Args:
+        argv: Arguments without the program name (e.g. ["all", "--fast"])
+    
+    Returns:
+        Exit code of the command
+    """
+    # A bare command name needs no option parsing (nor argparse at all)
+    if len(argv) == 1 and argv[0] in _COMMANDS:
+        return _COMMANDS[argv[0]]()
+    
     # Handle no arguments
-    if len(sys.argv) == 1:
-        parser.print_help()
+    if not argv:
+        _get_parser().print_help()
         return 0
     
-    args = parser.parse_args()
-    
-    # Command dispatch
-    commands = {
-        "lint": cmd_lint,
-        "test": cmd_test,
-        "build": cmd_build,
-        "docker": cmd_docker,
-        "publish": cmd_publish,
-        "all": cmd_all,
-        "version": cmd_version,
-        "help": cmd_help,
-    }
-    
-    # Execute the command
-    cmd_func = commands.get(args.command)
-    if cmd_func:
-        return cmd_func()
-    else:
-        print_error(f"Unknown command: {args.command}")
-        return 1
+    args = _get_parser().parse_args(argv)
+    
+    if args.command == "all":
+        return cmd_all(fast=args.fast)
+    return _COMMANDS[args.command]()
+
+
+def main() -> int:
+    """Main entry point for the CLI."""
+    return dispatch(sys.argv[1:])
 
 
 if __name__ == "__main__":
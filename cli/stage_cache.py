@@ -0,0 +1,223 @@
+"""
+stage_cache - Skip pipeline stages whose inputs have not changed
+
+Before a stage runs, its input files are hashed. The hash, the exit
+code and the output files are stored in .devopsctl-cache/<stage>.json
+afterwards. When the last run succeeded, the hash still matches and its
+outputs still exist, the stage is skipped.
+
+Only lint, test and build are cached. docker and publish depend on the
+state of the Docker daemon and exit 0 when they skip their work, so a
+successful exit does not mean their output exists.
+
+Environment:
+    DEVOPSCTL_FORCE=1         Ignore cached results and run every stage
+    DEVOPSCTL_CACHE_STRICT=1  Hash file contents instead of mtime + size
+"""
+
+import glob
+import hashlib
+import json
+import os
+import time
+from stat import S_ISREG
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CACHE_DIR_NAME = ".devopsctl-cache"
+
+# Glob patterns (relative to the project root) that each cacheable stage
+# depends on. A pattern ending in "/**" matches every file below that
+# directory except those in EXCLUDED_DIRS.
+STAGE_INPUTS = {
+    "lint": [
+        "scripts/lint.sh",
+        "service/*.js",
+        "service/__tests__/**/*.js",
+    ],
+    "test": [
+        "scripts/test.sh",
+        "service/*.js",
+        "service/__tests__/**/*.js",
+    ],
+    "build": [
+        "scripts/build.sh",
+        "VERSION",
+        # Everything `npm pack` puts in the tarball
+        "service/**",
+        # The artifact name embeds the current commit hash
+        ".git/HEAD",
+        ".git/refs/heads/**",
+    ],
+}
+
+# Glob patterns (relative to the project root) of the files each stage
+# produces. The stage is rerun when any of them has been removed.
+STAGE_OUTPUTS = {
+    "build": ["dist/*.tgz"],
+}
+
+# Directories `npm pack` never ships; node_modules is also far too big to
+# stat on every run
+EXCLUDED_DIRS = frozenset({"node_modules", ".pytest_cache"})
+
+# Files hashed by content even without DEVOPSCTL_CACHE_STRICT. build
+# rewrites package.json via `npm version`, which touches its mtime.
+CONTENT_HASHED = frozenset({"service/package.json"})
+
+
+def _expand(project_root: str, pattern: str) -> Iterable[str]:
+    """List the paths matching a pattern relative to project_root."""
+    if not pattern.endswith("/**"):
+        return glob.glob(os.path.join(project_root, pattern), recursive=True)
+
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(os.path.join(project_root, pattern[:-3])):
+        dirnames[:] = [name for name in dirnames if name not in EXCLUDED_DIRS]
+        paths.extend(os.path.join(dirpath, name) for name in filenames)
+    return paths
+
+
+def _stat_files(paths: Iterable[str]) -> Dict[str, Tuple[float, int]]:
+    """Get (mtime, size) of the regular files among paths, one stat each."""
+    results = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if S_ISREG(st.st_mode):
+            results[path] = (st.st_mtime, st.st_size)
+    return results
+
+
+def compute_input_hash(project_root: str, stage: str, strict: bool = False) -> Optional[str]:
+    """
+    Hash the input files of a stage.
+
+    Args:
+        project_root: Root directory of the project
+        stage: Name of the stage
+        strict: Hash file contents instead of mtime and size
+
+    Returns:
+        Hex digest of the inputs, or None if the stage is not cacheable
+    """
+    patterns = STAGE_INPUTS.get(stage)
+    if patterns is None:
+        return None
+
+    paths = set()
+    for pattern in patterns:
+        paths.update(_expand(project_root, pattern))
+
+    stats = _stat_files(paths)
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(stats):
+        relpath = os.path.relpath(path, project_root).replace(os.sep, "/")
+        digest.update(relpath.encode("utf-8"))
+        if strict or relpath in CONTENT_HASHED:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        else:
+            mtime, size = stats[path]
+            digest.update(f":{mtime!r}:{size}\n".encode("ascii"))
+
+    return digest.hexdigest()
+
+
+def _list_outputs(project_root: str, stage: str) -> List[str]:
+    """List the output files of a stage, relative to project_root."""
+    outputs = set()
+    for pattern in STAGE_OUTPUTS.get(stage, ()):
+        outputs.update(_expand(project_root, pattern))
+    return sorted(os.path.relpath(path, project_root) for path in outputs)
+
+
+def _cache_file(project_root: str, stage: str) -> str:
+    return os.path.join(project_root, CACHE_DIR_NAME, f"{stage}.json")
+
+
+def current_input_hash(project_root: str, stage: str) -> Optional[str]:
+    """
+    Hash the input files of a stage, honoring DEVOPSCTL_CACHE_STRICT.
+
+    Call this before running the stage and pass the result to is_fresh
+    and record, so edits made while the stage runs are not recorded as
+    checked.
+
+    Args:
+        project_root: Root directory of the project
+        stage: Name of the stage
+
+    Returns:
+        Hex digest of the inputs, or None if the stage is not cacheable
+    """
+    strict = os.environ.get("DEVOPSCTL_CACHE_STRICT") == "1"
+    return compute_input_hash(project_root, stage, strict=strict)
+
+
+def is_fresh(project_root: str, stage: str, input_hash: Optional[str]) -> bool:
+    """
+    Check whether a stage succeeded before with the given inputs and its
+    outputs are still there.
+
+    Args:
+        project_root: Root directory of the project
+        stage: Name of the stage
+        input_hash: Hash from current_input_hash
+
+    Returns:
+        True if the stage can be skipped
+    """
+    if input_hash is None or os.environ.get("DEVOPSCTL_FORCE") == "1":
+        return False
+
+    try:
+        with open(_cache_file(project_root, stage), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if entry.get("exit_code") != 0 or entry.get("input_hash") != input_hash:
+        return False
+
+    if stage in STAGE_OUTPUTS:
+        # e.g. dist/ was cleaned; a run that produced nothing is never fresh
+        outputs = entry.get("outputs")
+        if not outputs:
+            return False
+        return all(os.path.isfile(os.path.join(project_root, path)) for path in outputs)
+
+    return True
+
+
+def record(project_root: str, stage: str, input_hash: Optional[str], exit_code: int) -> None:
+    """
+    Store the result of a stage run.
+
+    Cache write errors never fail the pipeline.
+
+    Args:
+        project_root: Root directory of the project
+        stage: Name of the stage
+        input_hash: Hash taken by current_input_hash before the run
+        exit_code: Exit code of the stage
+    """
+    if input_hash is None:
+        return
+
+    entry = {
+        "input_hash": input_hash,
+        "exit_code": exit_code,
+        "outputs": _list_outputs(project_root, stage),
+        "timestamp": time.time(),
+    }
+
+    cache_file = _cache_file(project_root, stage)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+    except OSError:
+        pass
@@ -0,0 +1,142 @@
+"""
+Unit tests for devopsctl module.
+"""
+
+import pytest
+import tempfile
+import os
+import sys
+
+# Add cli to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import devopsctl
+from devopsctl import PIPELINE_STAGES, BashDaemon, cmd_all, run_scripts
+
+
+@pytest.fixture
+def project_root(monkeypatch):
+    """Empty project whose scripts are written by each test."""
+    monkeypatch.setenv("DEVOPSCTL_FORCE", "1")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.makedirs(os.path.join(tmpdir, "scripts"))
+        monkeypatch.setattr(devopsctl, "PROJECT_ROOT", tmpdir)
+        monkeypatch.setattr(devopsctl, "SCRIPT_PATHS", {
+            name: os.path.join(tmpdir, "scripts", f"{name}.sh") for name in PIPELINE_STAGES
+        })
+        monkeypatch.setattr(devopsctl, "_available_scripts", None)
+        yield tmpdir
+
+
+def write_scripts(root, **bodies):
+    """Write a stub script for every stage; each one leaves a marker file."""
+    for name in PIPELINE_STAGES:
+        body = bodies.get(name, "exit 0")
+        with open(os.path.join(root, "scripts", f"{name}.sh"), "w", encoding="utf-8") as f:
+            f.write(f"touch {name}.ran\n{body}\n")
+
+
+def ran(root, name):
+    """Check whether the script of a stage was started."""
+    return os.path.exists(os.path.join(root, f"{name}.ran"))
+
+
+class TestCmdAll:
+    """Tests for the cmd_all stage scheduler."""
+
+    def test_success(self, project_root):
+        """Every stage should run when all of them succeed."""
+        write_scripts(project_root)
+        assert cmd_all() == 0
+        assert all(ran(project_root, name) for name in PIPELINE_STAGES)
+
+    def test_build_waits_for_lint_and_test(self, project_root):
+        """build should only start after both lint and test finished."""
+        write_scripts(
+            project_root,
+            lint="sleep 0.2; touch lint.done",
+            test="sleep 0.2; touch test.done",
+            build="test -f lint.done && test -f test.done",
+        )
+        assert cmd_all() == 0
+
+    def test_lint_failure_skips_build(self, project_root):
+        """build and later stages should never start when lint fails."""
+        write_scripts(project_root, lint="exit 2")
+        assert cmd_all() == 2
+        assert ran(project_root, "test")
+        assert not ran(project_root, "build")
+        assert not ran(project_root, "docker")
+        assert not ran(project_root, "publish")
+
+    def test_test_failure_skips_build(self, project_root):
+        """build should never start when test fails."""
+        write_scripts(project_root, test="exit 5")
+        assert cmd_all() == 5
+        assert ran(project_root, "lint")
+        assert not ran(project_root, "build")
+
+    def test_first_failure_exit_code(self, project_root):
+        """The exit code of the stage that failed first should be returned."""
+        write_scripts(project_root, lint="sleep 0.5; exit 4", test="exit 3")
+        assert cmd_all() == 3
+        assert not ran(project_root, "build")
+
+    def test_later_stage_failure(self, project_root):
+        """A failing stage should stop the stages that depend on it."""
+        write_scripts(project_root, docker="exit 7")
+        assert cmd_all() == 7
+        assert ran(project_root, "build")
+        assert not ran(project_root, "publish")
+
+    def test_missing_script(self, project_root):
+        """A missing script should fail its stage."""
+        write_scripts(project_root)
+        os.remove(os.path.join(project_root, "scripts", "test.sh"))
+        assert cmd_all() == 1
+        assert not ran(project_root, "build")
+
+
+class TestBashDaemon:
+    """Tests for BashDaemon and run_scripts."""
+
+    def test_exit_code(self, project_root):
+        """run should return the exit code of the script."""
+        write_scripts(project_root, lint="echo hello; exit 3")
+        with BashDaemon() as bash:
+            assert bash.run("lint") == 3
+
+    def test_output_without_trailing_newline(self, project_root, capsys):
+        """A last output line without newline should not hide the sentinel."""
+        write_scripts(project_root, lint='echo first; printf "x"; exit 3')
+        with BashDaemon() as bash:
+            assert bash.run("lint") == 3
+        assert capsys.readouterr().out == "first\nx\n"
+
+    def test_runs_scripts_in_sequence(self, project_root):
+        """exit and set -e in a script should only end that script."""
+        write_scripts(project_root, lint="set -e; false", test="exit 0")
+        with BashDaemon() as bash:
+            assert bash.run("lint") == 1
+            assert bash.run("test") == 0
+        assert ran(project_root, "test")
+
+    def test_script_does_not_read_commands(self, project_root):
+        """Scripts should not consume the commands sent to the daemon."""
+        write_scripts(project_root, lint="cat", test="exit 0")
+        with BashDaemon() as bash:
+            assert bash.run("lint") == 0
+            assert bash.run("test") == 0
+
+    def test_bash_dies_before_sentinel(self, project_root):
+        """run should return 1 when bash exits without reporting a result."""
+        write_scripts(project_root, lint="kill -KILL $$")
+        with BashDaemon() as bash:
+            assert bash.run("lint") == 1
+
+    def test_run_scripts_stops_at_failure(self, project_root):
+        """run_scripts should return the first failing exit code."""
+        write_scripts(project_root, test="exit 6")
+        assert run_scripts(list(PIPELINE_STAGES)) == 6
+        assert ran(project_root, "lint")
+        assert not ran(project_root, "build")
@@ -0,0 +1,184 @@
+"""
+Unit tests for stage_cache module.
+"""
+
+import pytest
+import tempfile
+import os
+import sys
+
+# Add cli to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from stage_cache import (
+    compute_input_hash,
+    current_input_hash,
+    is_fresh,
+    record,
+)
+
+
+@pytest.fixture
+def project_root(monkeypatch):
+    """Minimal project tree with the lint stage inputs."""
+    monkeypatch.delenv("DEVOPSCTL_FORCE", raising=False)
+    monkeypatch.delenv("DEVOPSCTL_CACHE_STRICT", raising=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.makedirs(os.path.join(tmpdir, "scripts"))
+        os.makedirs(os.path.join(tmpdir, "service"))
+        write_file(tmpdir, "scripts/lint.sh", "npm run lint\n")
+        write_file(tmpdir, "service/index.js", "module.exports = {};\n")
+        yield tmpdir
+
+
+def write_file(root, relpath, content, mtime=None):
+    """Write a file below root, optionally with a fixed mtime."""
+    path = os.path.join(root, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+class TestComputeInputHash:
+    """Tests for compute_input_hash function."""
+
+    def test_unknown_stage(self, project_root):
+        """Stages without declared inputs should not be cacheable."""
+        assert compute_input_hash(project_root, "docker") is None
+        assert compute_input_hash(project_root, "publish") is None
+
+    def test_stable(self, project_root):
+        """Hash should not change while inputs are unchanged."""
+        first = compute_input_hash(project_root, "lint")
+        assert compute_input_hash(project_root, "lint") == first
+
+    def test_changes_with_content(self, project_root):
+        """Hash should change when an input file changes."""
+        before = compute_input_hash(project_root, "lint")
+        write_file(project_root, "service/index.js", "module.exports = { a: 1 };\n")
+        assert compute_input_hash(project_root, "lint") != before
+
+    def test_changes_with_new_file(self, project_root):
+        """Hash should change when a matching file is added."""
+        before = compute_input_hash(project_root, "lint")
+        write_file(project_root, "service/extra.js", "\n")
+        assert compute_input_hash(project_root, "lint") != before
+
+    def test_ignores_unrelated_files(self, project_root):
+        """Files outside the stage inputs should not affect the hash."""
+        before = compute_input_hash(project_root, "lint")
+        write_file(project_root, "notes.txt", "hello\n")
+        assert compute_input_hash(project_root, "lint") == before
+
+    def test_strict_ignores_mtime(self, project_root):
+        """Strict mode should only depend on file contents."""
+        strict = compute_input_hash(project_root, "lint", strict=True)
+        fast = compute_input_hash(project_root, "lint")
+        write_file(project_root, "service/index.js", "module.exports = {};\n", mtime=1)
+
+        assert compute_input_hash(project_root, "lint", strict=True) == strict
+        assert compute_input_hash(project_root, "lint") != fast
+
+    def test_strict_from_environment(self, project_root, monkeypatch):
+        """DEVOPSCTL_CACHE_STRICT=1 should select content hashing."""
+        monkeypatch.setenv("DEVOPSCTL_CACHE_STRICT", "1")
+        expected = compute_input_hash(project_root, "lint", strict=True)
+        assert current_input_hash(project_root, "lint") == expected
+
+
+class TestBuildInputs:
+    """Tests for the inputs and outputs of the build stage."""
+
+    def test_python_sources(self, project_root):
+        """Every file shipped by npm pack should be a build input."""
+        write_file(project_root, "service/src/main.py", "print('a')\n")
+        before = compute_input_hash(project_root, "build")
+        write_file(project_root, "service/src/main.py", "print('b')\n")
+        assert compute_input_hash(project_root, "build") != before
+
+    def test_ignores_node_modules(self, project_root):
+        """Installed dependencies should not affect the build hash."""
+        before = compute_input_hash(project_root, "build")
+        write_file(project_root, "service/node_modules/dep/index.js", "\n")
+        assert compute_input_hash(project_root, "build") == before
+
+    def test_package_json_by_content(self, project_root):
+        """package.json rewritten with the same content should stay fresh."""
+        write_file(project_root, "service/package.json", '{"version": "0.1.0"}\n', mtime=1)
+        before = compute_input_hash(project_root, "build")
+        write_file(project_root, "service/package.json", '{"version": "0.1.0"}\n', mtime=2)
+        assert compute_input_hash(project_root, "build") == before
+
+        write_file(project_root, "service/package.json", '{"version": "0.2.0"}\n', mtime=2)
+        assert compute_input_hash(project_root, "build") != before
+
+    def test_stale_without_artifact(self, project_root):
+        """build should rerun once its tarball is gone from dist/."""
+        write_file(project_root, "dist/service-0.1.0-abc1234.tgz", "tgz")
+        input_hash = current_input_hash(project_root, "build")
+        record(project_root, "build", input_hash, 0)
+        assert is_fresh(project_root, "build", input_hash)
+
+        os.remove(os.path.join(project_root, "dist", "service-0.1.0-abc1234.tgz"))
+        assert is_fresh(project_root, "build", input_hash) is False
+
+    def test_stale_without_any_output(self, project_root):
+        """A build that produced no tarball should not be fresh."""
+        input_hash = current_input_hash(project_root, "build")
+        record(project_root, "build", input_hash, 0)
+        assert is_fresh(project_root, "build", input_hash) is False
+
+
+class TestFreshness:
+    """Tests for is_fresh and record functions."""
+
+    def test_not_fresh_without_record(self, project_root):
+        """A stage that never ran should not be fresh."""
+        input_hash = current_input_hash(project_root, "lint")
+        assert is_fresh(project_root, "lint", input_hash) is False
+
+    def test_fresh_after_success(self, project_root):
+        """A successful run with the same inputs should be fresh."""
+        input_hash = current_input_hash(project_root, "lint")
+        record(project_root, "lint", input_hash, 0)
+        assert is_fresh(project_root, "lint", current_input_hash(project_root, "lint"))
+
+    def test_not_fresh_after_failure(self, project_root):
+        """A failed run should never be skipped."""
+        input_hash = current_input_hash(project_root, "lint")
+        record(project_root, "lint", input_hash, 1)
+        assert is_fresh(project_root, "lint", input_hash) is False
+
+    def test_not_fresh_after_change(self, project_root):
+        """Changed inputs should invalidate the recorded run."""
+        record(project_root, "lint", current_input_hash(project_root, "lint"), 0)
+        write_file(project_root, "service/index.js", "module.exports = { a: 1 };\n")
+        assert is_fresh(project_root, "lint", current_input_hash(project_root, "lint")) is False
+
+    def test_records_hash_from_before_run(self, project_root):
+        """Edits made while a stage runs should not be recorded as checked."""
+        input_hash = current_input_hash(project_root, "lint")
+        write_file(project_root, "service/index.js", "edited during run\n")
+        record(project_root, "lint", input_hash, 0)
+        assert is_fresh(project_root, "lint", current_input_hash(project_root, "lint")) is False
+
+    def test_force(self, project_root, monkeypatch):
+        """DEVOPSCTL_FORCE=1 should bypass the cache."""
+        input_hash = current_input_hash(project_root, "lint")
+        record(project_root, "lint", input_hash, 0)
+        monkeypatch.setenv("DEVOPSCTL_FORCE", "1")
+        assert is_fresh(project_root, "lint", input_hash) is False
+
+    def test_uncacheable_stage(self, project_root):
+        """Stages without declared inputs should never be recorded or fresh."""
+        record(project_root, "docker", None, 0)
+        assert is_fresh(project_root, "docker", None) is False
+        assert not os.path.exists(os.path.join(project_root, ".devopsctl-cache", "docker.json"))
+
+    def test_corrupt_cache_file(self, project_root):
+        """An unreadable cache entry should count as a miss."""
+        os.makedirs(os.path.join(project_root, ".devopsctl-cache"))
+        write_file(project_root, ".devopsctl-cache/lint.json", "{not json")
+        assert is_fresh(project_root, "lint", current_input_hash(project_root, "lint")) is False
@@ -11,7 +11,9 @@ This service demonstrates a sample application that can be:
 import logging
 import os
 import sys
-from typing import Dict, Any
+from array import array
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple, Union
 
 # Configure logging
 logging.basicConfig(
@@ -29,36 +31,75 @@ def get_version() -> str:
     return VERSION
 
 
+def _load_config() -> Mapping[str, Any]:
+    """Read configuration values from environment variables."""
+    return MappingProxyType({
+        "app_name": os.getenv("APP_NAME", "devops-toolchain"),
+        "environment": os.getenv("ENVIRONMENT", "development"),
+        "log_level": os.getenv("LOG_LEVEL", "INFO"),
+        "version": VERSION,
+    })
+
+
+# Configuration and runtime checks are fixed for the life of the process
+_CONFIG = _load_config()
+_RUNTIME_CHECKS = MappingProxyType({
+    "python": sys.version,
+    "platform": sys.platform,
+})
+
+
 def get_config() -> Dict[str, Any]:
     """
-    Load configuration from environment variables.
+    Get configuration loaded from environment variables.
+    
+    The environment is read once at import time. Set
+    DEVOPSCTL_RELOAD_CONFIG to re-read it on every call.
     
     Returns:
         Dictionary containing configuration values.
     """
-    return {
-        "app_name": os.getenv("APP_NAME", "devops-toolchain"),
-        "environment": os.getenv("ENVIRONMENT", "development"),
-        "log_level": os.getenv("LOG_LEVEL", "INFO"),
-        "version": get_version(),
-    }
+    global _CONFIG
+    if os.getenv("DEVOPSCTL_RELOAD_CONFIG"):
+        _CONFIG = _load_config()
+    return dict(_CONFIG)
+
 
+# Built once; nothing in the health payload changes while the process runs.
+# Copies are made from a plain dict: copying a MappingProxyType goes through
+# the generic mapping protocol and is several times slower.
+_CHECKS = dict(_RUNTIME_CHECKS)
+_HEALTH = MappingProxyType({
+    "status": "healthy",
+    "version": VERSION,
+    "checks": MappingProxyType(_CHECKS),
+})
 
-def health_check() -> Dict[str, Any]:
+
+def health_check(copy: bool = True) -> Union[Dict[str, Any], Mapping[str, Any]]:
     """
     Perform a health check of the service.
     
+    Args:
+        copy: Return a fresh, mutable (and JSON serializable) dictionary.
+            With copy=False the shared read-only payload is returned
+            without allocating.
+    
     Returns:
-        Dictionary containing health status.
+        Dictionary containing health status, or a read-only mapping.
     """
-    return {
-        "status": "healthy",
-        "version": get_version(),
-        "checks": {
-            "python": sys.version,
-            "platform": sys.platform,
+    if copy:
+        return {
+            "status": "healthy",
+            "version": VERSION,
+            "checks": _CHECKS.copy(),
         }
-    }
+    return _HEALTH
+
+
+def _count_items(data: Any) -> int:
+    """Count the items of a task payload (0 for non-dict payloads)."""
+    return len(data) if isinstance(data, dict) else 0
 
 
 def process_task(task_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -72,19 +113,47 @@ def process_task(task_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Processing result.
     """
-    logger.info(f"Processing task: {task_id}")
+    logger.info("Processing task: %s", task_id)
     
+    items_count = _count_items(data)
     result = {
         "task_id": task_id,
         "status": "completed",
         "input": data,
         "output": {
             "processed": True,
-            "items_count": len(data) if isinstance(data, dict) else 0,
+            "items_count": items_count,
         }
     }
     
-    logger.info(f"Task {task_id} completed successfully")
+    logger.info("Task %s completed successfully", task_id)
+    return result
+
+
+def process_tasks(tasks: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Process a batch of tasks.
+    
+    Results are returned column-wise (one sequence per field, aligned by
+    position) rather than as one nested dict per task, which keeps large
+    batches compact and cheap to aggregate.
+    
+    Args:
+        tasks: List of (task_id, data) pairs.
+    
+    Returns:
+        Dictionary with "task_id" and "status" lists and an
+        "items_count" integer array.
+    """
+    logger.info("Processing %d tasks", len(tasks))
+    
+    result = {
+        "task_id": [task_id for task_id, _ in tasks],
+        "status": ["completed"] * len(tasks),
+        "items_count": array("l", [_count_items(data) for _, data in tasks]),
+    }
+    
+    logger.info("Batch of %d tasks completed successfully", len(tasks))
     return result
 
 
@@ -96,18 +165,18 @@ def main() -> None:
     
     # Load configuration
     config = get_config()
-    logger.info(f"Configuration: {config}")
+    logger.info("Configuration: %s", config)
     
     # Perform health check
     health = health_check()
-    logger.info(f"Health check: {health}")
+    logger.info("Health check: %s", health)
     
     # Process a sample task
     sample_task = process_task(
         task_id="demo-001",
         data={"message": "Hello from DevOps Toolchain!"}
     )
-    logger.info(f"Sample task result: {sample_task}")
+    logger.info("Sample task result: %s", sample_task)
     
     logger.info("=" * 50)
     logger.info("Service initialization complete!")
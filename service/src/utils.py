@@ -2,12 +2,31 @@
 Utility functions for the DevOps Toolchain Service.
 """
 
-import hashlib
 import json
+import math
 import os
-from datetime import datetime, timezone
+import re
+import secrets
+import time
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+# Directories already created by save_json_file
+_ensured_dirs = set()
+
+# major.minor.patch at the start of a version string
+_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)")
+
+# 19+ digit runs may be integers outside the 64-bit range, which orjson
+# parses as floats
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
 
 def generate_id(prefix: str = "id") -> str:
     """
@@ -17,12 +36,9 @@ def generate_id(prefix: str = "id") -> str:
         prefix: Prefix for the ID.
     
     Returns:
-        Unique string identifier.
+        Unique string identifier with 12 random hex characters.
     """
-    timestamp = datetime.now(timezone.utc).isoformat()
-    hash_input = f"{prefix}-{timestamp}-{os.getpid()}"
-    hash_value = hashlib.sha256(hash_input.encode()).hexdigest()[:12]
-    return f"{prefix}-{hash_value}"
+    return f"{prefix}-{secrets.token_hex(6)}"
 
 
 def load_json_file(filepath: str) -> Optional[Dict[str, Any]]:
@@ -35,25 +51,90 @@ def load_json_file(filepath: str) -> Optional[Dict[str, Any]]:
     Returns:
         Parsed JSON data or None if file doesn't exist.
     """
-    if not os.path.exists(filepath):
+    # EAFP: a single open() instead of exists() + open(), without the race
+    try:
+        with open(filepath, 'rb') as f:
+            content = f.read()
+    except (FileNotFoundError, NotADirectoryError):
         return None
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    if orjson is not None and not _LONG_DIGITS_RE.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity written by the stdlib fallback; let json decide
+            pass
+    return json.loads(content)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check whether a JSON-like structure contains NaN or infinity."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data like json.dumps(indent=2, default=str), as bytes."""
+    if orjson is not None:
+        try:
+            # Datetimes and dataclasses go through default=str like stdlib
+            payload = orjson.dumps(
+                data,
+                default=str,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                ),
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            pass
+        else:
+            # orjson writes NaN and infinity as null; only look if one exists
+            if b"null" not in payload or not _has_non_finite(data):
+                return payload
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
 
 
 def save_json_file(filepath: str, data: Dict[str, Any]) -> None:
     """
     Save data to a JSON file.
     
+    Uses orjson when it is installed and falls back to the stdlib json
+    module for data orjson cannot represent the same way (integers wider
+    than 64 bits, NaN and infinity). Values that are not JSON serializable
+    are stored as strings, except Enum members: orjson stores their value,
+    the stdlib json module their str().
+    
     Args:
         filepath: Path to the JSON file.
         data: Data to save.
     """
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    payload = _dumps(data)
+    
+    directory = os.path.dirname(filepath)
+    if directory and directory not in _ensured_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str)
+    try:
+        f = open(filepath, 'wb')
+    except FileNotFoundError:
+        if not directory:
+            raise
+        # The directory was removed after it was created here
+        os.makedirs(directory, exist_ok=True)
+        f = open(filepath, 'wb')
+    
+    with f:
+        f.write(payload)
 
 
 def format_timestamp(dt: Optional[datetime] = None) -> str:
@@ -67,22 +148,34 @@ def format_timestamp(dt: Optional[datetime] = None) -> str:
         ISO 8601 formatted string.
     """
     if dt is None:
-        dt = datetime.now(timezone.utc)
+        t = time.gmtime()
+        return (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+        )
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+@lru_cache(maxsize=256)
 def parse_version(version_string: str) -> tuple:
     """
     Parse a semantic version string.
     
+    Anything after major.minor.patch (e.g. "-beta") is ignored.
+    
     Args:
         version_string: Version string (e.g., "1.2.3").
     
     Returns:
         Tuple of (major, minor, patch).
+    
+    Raises:
+        ValueError: If the string does not start with major.minor.patch.
     """
-    parts = version_string.split('.')
-    return tuple(int(p) for p in parts[:3])
+    match = _VERSION_RE.match(version_string)
+    if match is None:
+        raise ValueError(f"Invalid version string: {version_string!r}")
+    return (int(match[1]), int(match[2]), int(match[3]))
 
 
 def bump_version(version_string: str, bump_type: str = "patch") -> str:
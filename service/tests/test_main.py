@@ -2,6 +2,7 @@
 Unit tests for main module.
 """
 
+import json
 import pytest
 import sys
 import os
@@ -9,7 +10,7 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from main import get_config, health_check, process_task
+from main import get_config, health_check, process_task, process_tasks
 
 
 class TestGetConfig:
@@ -36,6 +37,22 @@ class TestGetConfig:
         """Default environment should be development."""
         config = get_config()
         assert config["environment"] == "development"
+    
+    def test_returns_copy(self):
+        """Mutating the returned config should not affect later calls."""
+        config = get_config()
+        config["app_name"] = "changed"
+        assert get_config()["app_name"] == "devops-toolchain"
+    
+    def test_reload_config(self, monkeypatch):
+        """Config should be re-read when DEVOPSCTL_RELOAD_CONFIG is set."""
+        monkeypatch.setenv("DEVOPSCTL_RELOAD_CONFIG", "1")
+        monkeypatch.setenv("APP_NAME", "reloaded")
+        assert get_config()["app_name"] == "reloaded"
+        
+        # Restore the defaults for the other tests
+        monkeypatch.delenv("APP_NAME")
+        assert get_config()["app_name"] == "devops-toolchain"
 
 
 class TestHealthCheck:
@@ -62,6 +79,27 @@ class TestHealthCheck:
         assert "checks" in health
         assert "python" in health["checks"]
         assert "platform" in health["checks"]
+    
+    def test_mutation_is_isolated(self):
+        """Mutating a result should not affect later health checks."""
+        health = health_check()
+        health["status"] = "degraded"
+        health["checks"]["python"] = "changed"
+        assert health_check()["status"] == "healthy"
+        assert health_check()["checks"]["python"] != "changed"
+    
+    def test_shared_payload_is_read_only(self):
+        """The copy=False payload should reject modification."""
+        health = health_check(copy=False)
+        with pytest.raises(TypeError):
+            health["status"] = "degraded"
+        with pytest.raises(TypeError):
+            health["checks"]["python"] = "changed"
+        assert health == health_check()
+    
+    def test_json_serializable(self):
+        """The default result should be JSON serializable."""
+        assert json.loads(json.dumps(health_check()))["status"] == "healthy"
 
 
 class TestProcessTask:
@@ -96,3 +134,28 @@ class TestProcessTask:
         assert result["output"]["processed"] is True
         assert result["output"]["items_count"] == 2
 
+
+class TestProcessTasks:
+    """Tests for process_tasks function."""
+    
+    def test_columns_aligned(self):
+        """Columns should hold one entry per task, in order."""
+        result = process_tasks([("t-1", {"a": 1}), ("t-2", {}), ("t-3", {"a": 1, "b": 2})])
+        assert result["task_id"] == ["t-1", "t-2", "t-3"]
+        assert result["status"] == ["completed"] * 3
+        assert list(result["items_count"]) == [1, 0, 2]
+    
+    def test_matches_process_task(self):
+        """Batch results should match single-task processing."""
+        tasks = [("t-1", {"a": 1, "b": 2}), ("t-2", "not a dict")]
+        result = process_tasks(tasks)
+        for i, (task_id, data) in enumerate(tasks):
+            single = process_task(task_id, data)
+            assert result["status"][i] == single["status"]
+            assert result["items_count"][i] == single["output"]["items_count"]
+    
+    def test_empty_batch(self):
+        """Empty batch should give empty columns."""
+        result = process_tasks([])
+        assert result["task_id"] == []
+        assert len(result["items_count"]) == 0
@@ -4,12 +4,17 @@ Unit tests for utils module.
 
 import pytest
 import tempfile
+import math
 import os
 import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import utils
 from utils import (
     generate_id,
     load_json_file,
@@ -20,6 +25,10 @@ from utils import (
 )
 
 
+class Color(Enum):
+    RED = 1
+
+
 class TestGenerateId:
     """Tests for generate_id function."""
     
@@ -38,6 +47,12 @@ class TestGenerateId:
         """Generated IDs should be unique."""
         ids = [generate_id() for _ in range(100)]
         assert len(ids) == len(set(ids))
+    
+    def test_hex_suffix(self):
+        """ID should end with 12 hex characters."""
+        suffix = generate_id("task").split("-", 1)[1]
+        assert len(suffix) == 12
+        int(suffix, 16)
 
 
 class TestJsonFiles:
@@ -59,6 +74,21 @@ class TestJsonFiles:
         result = load_json_file("/nonexistent/path/file.json")
         assert result is None
     
+    def test_load_missing_file_in_existing_directory(self):
+        """Should return None for a missing file in an existing directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = load_json_file(os.path.join(tmpdir, "missing.json"))
+            assert result is None
+    
+    def test_load_below_regular_file(self):
+        """Should return None when a parent path component is a file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            save_json_file(filepath, {"test": True})
+            
+            result = load_json_file(os.path.join(filepath, "nested.json"))
+            assert result is None
+    
     def test_creates_directories(self):
         """Should create parent directories."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -68,6 +98,109 @@ class TestJsonFiles:
             save_json_file(filepath, data)
             
             assert os.path.exists(filepath)
+    
+    def test_recreates_removed_directory(self):
+        """Should recreate a directory removed after an earlier save."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            subdir = os.path.join(tmpdir, "subdir")
+            filepath = os.path.join(subdir, "test.json")
+            
+            save_json_file(filepath, {"run": 1})
+            os.remove(filepath)
+            os.rmdir(subdir)
+            save_json_file(filepath, {"run": 2})
+            
+            assert load_json_file(filepath) == {"run": 2}
+    
+    def test_save_in_current_directory(self, monkeypatch):
+        """Should save a bare filename to the current directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.chdir(tmpdir)
+            
+            save_json_file("test.json", {"test": True})
+            
+            assert load_json_file("test.json") == {"test": True}
+    
+    def test_non_serializable_as_string(self):
+        """Values that are not JSON types should be saved as strings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+            
+            save_json_file(filepath, {"when": when})
+            
+            assert load_json_file(filepath) == {"when": str(when)}
+    
+    def test_stdlib_fallback(self, monkeypatch):
+        """Should save and load without orjson installed."""
+        monkeypatch.setattr(utils, "orjson", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            data = {"key": "value", "number": 42}
+            
+            save_json_file(filepath, data)
+            
+            assert load_json_file(filepath) == data
+    
+    def test_integer_wider_than_64_bits(self):
+        """Should save integers orjson cannot encode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            data = {"big": 2 ** 70 + 1, "negative": -(2 ** 63) - 1}
+            
+            save_json_file(filepath, data)
+            loaded = load_json_file(filepath)
+            
+            assert loaded == data
+            assert type(loaded["big"]) is int
+            assert type(loaded["negative"]) is int
+    
+    def test_non_finite_floats(self):
+        """Should keep NaN and infinity instead of writing null."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            data = {"values": [float("nan"), float("inf"), -float("inf")], "none": None}
+            
+            save_json_file(filepath, data)
+            loaded = load_json_file(filepath)
+            
+            assert math.isnan(loaded["values"][0])
+            assert loaded["values"][1:] == [float("inf"), -float("inf")]
+            assert loaded["none"] is None
+    
+    def test_dataclass_saved_as_string(self):
+        """Should store dataclasses as strings like the stdlib json module."""
+        @dataclass
+        class Point:
+            x: int
+            y: int
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            
+            save_json_file(filepath, {"point": Point(1, 2)})
+            
+            assert load_json_file(filepath) == {"point": str(Point(1, 2))}
+    
+    @pytest.mark.skipif(utils.orjson is None, reason="orjson not installed")
+    def test_enum_with_orjson(self):
+        """orjson should store Enum members as their value."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            
+            save_json_file(filepath, {"color": Color.RED})
+            
+            assert load_json_file(filepath) == {"color": 1}
+    
+    def test_enum_without_orjson(self, monkeypatch):
+        """The stdlib fallback should store Enum members as strings."""
+        monkeypatch.setattr(utils, "orjson", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "test.json")
+            
+            save_json_file(filepath, {"color": Color.RED})
+            
+            assert load_json_file(filepath) == {"color": "Color.RED"}
 
 
 class TestFormatTimestamp:
@@ -83,6 +216,17 @@ class TestFormatTimestamp:
         result = format_timestamp()
         assert "T" in result
         assert result.endswith("Z")
+    
+    def test_current_time_matches_datetime(self):
+        """Current time should use the same layout as explicit datetimes."""
+        result = format_timestamp()
+        parsed = datetime.strptime(result, "%Y-%m-%dT%H:%M:%SZ")
+        assert format_timestamp(parsed) == result
+    
+    def test_explicit_datetime(self):
+        """Should format a given datetime."""
+        dt = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert format_timestamp(dt) == "2024-01-02T03:04:05Z"
 
 
 class TestParseVersion:
@@ -102,6 +246,16 @@ class TestParseVersion:
         """Should parse large version numbers."""
         result = parse_version("10.20.30")
         assert result == (10, 20, 30)
+    
+    def test_parse_prerelease(self):
+        """Should ignore a pre-release suffix."""
+        result = parse_version("1.2.3-beta.1")
+        assert result == (1, 2, 3)
+    
+    def test_parse_invalid(self):
+        """Should reject strings without major.minor.patch."""
+        with pytest.raises(ValueError):
+            parse_version("1.2")
 
 
 class TestBumpVersion: